@@ -1,5 +1,6 @@
 import redis.asyncio as redis
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_limiter import FastAPILimiter
 import uvicorn
@@ -7,7 +8,7 @@ import uvicorn
 from src.routes import contacts, auth, users
 from src.conf.config import settings
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
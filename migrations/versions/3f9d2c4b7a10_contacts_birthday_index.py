@@ -0,0 +1,39 @@
+"""contacts birthday index
+
+Revision ID: 3f9d2c4b7a10
+Revises: 6a0b1db1a310
+Create Date: 2026-10-15 10:12:41.208317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9d2c4b7a10"
+down_revision: Union[str, None] = "6a0b1db1a310"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expression index for birthday_to_week: (month, day) of "Born_date".
+    # to_char() is only STABLE in Postgres and can't be indexed, date_part() on
+    # a timestamp without time zone is IMMUTABLE.
+    op.create_index(
+        "ix_contacts_user_bday_mmdd",
+        "contacts",
+        [
+            "user_id",
+            sa.text('EXTRACT(month FROM "Born_date")'),
+            sa.text('EXTRACT(day FROM "Born_date")'),
+        ],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_bday_mmdd", table_name="contacts")
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     cloudinary_name: str
     cloudinary_api_key: str
     cloudinary_api_secret: str
+    # Proxy addresses allowed to set X-Forwarded-For, as a JSON list.
+    trusted_proxies: list[str] = []
 
     model_config = SettingsConfigDict(
         env_file="../.env", env_file_encoding="utf-8", extra="ignore"
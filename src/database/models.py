@@ -4,14 +4,15 @@ from sqlalchemy import (
     String,
     Boolean,
     Date,
+    extract,
     func,
+    Index,
     Table,
     UniqueConstraint,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql.sqltypes import DateTime
-from sqlalchemy_utils import EmailType
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from sqlalchemy.sql.schema import ForeignKey
 
 
@@ -20,17 +21,40 @@ Base = declarative_base()
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_name", "user_id", "name"),
+        Index("ix_contacts_user_lastname", "user_id", "lastname"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50))
     lastname = Column(String(50))
-    email = Column(EmailType)
+    # Stored lowercase: the repository lowers it on every write.
+    email = Column(String(320))
     phone = Column(String(50))
     born_date = Column("Born_date", DateTime, comment="Contact's birthday")
     description = Column(String(250))
     user_id = Column(
         "user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None
     )
-    user = relationship("User", backref="contacts")
+    # User.contacts is never lazy loaded, see users.get_user_with_contacts.
+    user = relationship("User", backref=backref("contacts", lazy="raise"))
+
+
+# Month and day of birth per user, serves the upcoming birthdays lookup.
+Index(
+    "ix_contacts_user_bday_mmdd",
+    Contact.user_id,
+    extract("month", Contact.born_date),
+    extract("day", Contact.born_date),
+)
+# Case-insensitive unique emails per user, also serves search by email.
+Index(
+    "ix_contacts_user_lower_email",
+    Contact.user_id,
+    func.lower(Contact.email),
+    unique=True,
+)
 
 
 class User(Base):
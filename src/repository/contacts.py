@@ -1,13 +1,75 @@
 from typing import List
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Date,
+    bindparam,
+    delete,
+    extract,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from src.database.models import Contact, User
-from datetime import date, datetime, timedelta
-from src.schemas import ContactEmail, ContactModel, ResponseContactModel
+from calendar import isleap
+from datetime import date, timedelta
+from src.schemas import ContactEmail, ContactModel
+
+# Statements are built once and reused with bound parameters, so SQLAlchemy
+# compiles each of them a single time and serves the rest from its cache.
+_OWNED_BY_USER = Contact.user_id == bindparam("owner_id")
+_OWNED_CONTACT = (Contact.id == bindparam("contact_id"), _OWNED_BY_USER)
+
+_INSERT_CONTACTS = insert(Contact).returning(Contact)
+# get_contacts reads plain rows shaped like ResponseContactModel, the other
+# lookups return whole contacts but must never lazy load a relationship.
+_SELECT_CONTACTS = select(
+    Contact.id,
+    Contact.name,
+    Contact.lastname,
+    Contact.email,
+    Contact.phone,
+    func.date(Contact.born_date, type_=Date).label("born_date"),
+    Contact.description,
+).where(_OWNED_BY_USER)
+# Keyset pagination: seek past after_id on (user_id, id), then skip/limit.
+_SELECT_CONTACTS_PAGE = (
+    _SELECT_CONTACTS.where(Contact.id > bindparam("after_id"))
+    .order_by(Contact.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SELECT_CONTACT_ROWS = select(Contact).options(raiseload("*"))
+_SELECT_CONTACT = _SELECT_CONTACT_ROWS.where(*_OWNED_CONTACT)
+_UPDATE_CONTACT = (
+    update(Contact)
+    .where(*_OWNED_CONTACT)
+    .returning(Contact)
+    .execution_options(populate_existing=True)
+)
+_DELETE_CONTACT = delete(Contact).where(*_OWNED_CONTACT).returning(Contact)
+_SEARCH_BY_NAME = _SELECT_CONTACT_ROWS.where(
+    Contact.name == bindparam("value"), _OWNED_BY_USER
+).limit(1)
+_SEARCH_BY_LASTNAME = _SELECT_CONTACT_ROWS.where(
+    Contact.lastname == bindparam("value"), _OWNED_BY_USER
+).limit(1)
+_SEARCH_BY_EMAIL = _SELECT_CONTACT_ROWS.where(
+    func.lower(Contact.email) == bindparam("value"), _OWNED_BY_USER
+).limit(1)
+_SELECT_BIRTHDAYS = _SELECT_CONTACT_ROWS.where(
+    _OWNED_BY_USER,
+    tuple_(
+        extract("month", Contact.born_date),
+        extract("day", Contact.born_date),
+    ).in_(bindparam("days", expanding=True)),
+)
 
 
 async def create_contact(
-    contact: ContactModel, user: User, db: Session
+    contact: ContactModel, user: User, db: AsyncSession
 ) -> ContactModel:
     """
     Creates a new contact for specific user.
@@ -17,42 +79,84 @@ async def create_contact(
     :param user: The user to create the note for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The newly created contsct.
     :rtype: ContactModel
     """
     new_contact = Contact(
         name=contact.name,
         lastname=contact.lastname,
-        email=contact.email,
+        email=contact.email.lower(),
         phone=contact.phone,
         born_date=contact.born_date,
         description=contact.description,
-        user=user,
+        user_id=user.id,
     )
 
+    # The primary key comes back from the INSERT itself and expire_on_commit is
+    # off, so there is nothing left to refresh.
     db.add(new_contact)
-    db.commit()
-    db.refresh(new_contact)
+    await db.commit()
 
     return new_contact
 
 
-async def get_contacts(user: User, db: Session) -> List[ResponseContactModel]:
+async def create_contacts_bulk(
+    contacts: List[ContactModel], user: User, db: AsyncSession
+) -> List[Contact]:
+    """
+    Creates several new contacts for specific user in a single statement.
+
+    :param contacts: The list of contact details.
+    :type contacts: List[ContactModel]
+    :param user: The user to create the contacts for.
+    :type user: User
+    :param db: The database session.
+    :type db: AsyncSession
+    :return: The newly created contacts.
+    :rtype: List[Contact]
+    """
+    if not contacts:
+        # An empty parameter list would run the INSERT once with no values.
+        return []
+    rows = [
+        {**contact.model_dump(), "email": contact.email.lower(), "user_id": user.id}
+        for contact in contacts
+    ]
+    result = await db.execute(_INSERT_CONTACTS, rows)
+    new_contacts = result.scalars().all()
+    await db.commit()
+
+    return new_contacts
+
+
+async def get_contacts(
+    user: User, db: AsyncSession, skip: int = 0, limit: int = 50, after_id: int = 0
+) -> List[dict]:
     """
     Retrieves a list of contacts for a specific user with specified pagination parameters.
 
     :param user: The user to retrieve contacts for.
     :type user: User
     :param db: The database session.
-    :type db: Session
-    :return: The list of found contacts.
-    :rtype: List[ResponseContactModel]
+    :type db: AsyncSession
+    :param skip: The number of contacts to skip.
+    :type skip: int
+    :param limit: The maximum number of contacts to return.
+    :type limit: int
+    :param after_id: Return only contacts with a greater ID.
+    :type after_id: int
+    :return: The list of found contacts, as ResponseContactModel fields.
+    :rtype: List[dict]
     """
-    return db.query(Contact).filter(Contact.user_id == user.id).all()
+    result = await db.execute(
+        _SELECT_CONTACTS_PAGE,
+        {"owner_id": user.id, "after_id": after_id, "skip": skip, "limit": limit},
+    )
+    return [dict(row) for row in result.mappings().all()]
 
 
-async def get_contact(contact_id: int, user: User, db: Session) -> ContactModel:
+async def get_contact(contact_id: int, user: User, db: AsyncSession) -> ContactModel:
     """
     Retrieves a single contact with the specified ID for a specific user.
 
@@ -61,26 +165,25 @@ async def get_contact(contact_id: int, user: User, db: Session) -> ContactModel:
     :param user: The user to retrieve contacts for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The specified contact.
     :rtype: ContactModel
     """
-    return (
-        db.query(Contact)
-        .filter(and_(Contact.id == contact_id, Contact.user_id == user.id))
-        .first()
+    result = await db.execute(
+        _SELECT_CONTACT, {"contact_id": contact_id, "owner_id": user.id}
     )
+    return result.scalar_one_or_none()
 
 
 async def update_contact(
     contact_id: int,
     user: User,
-    db: Session,
+    db: AsyncSession,
     name: str,
     lastname: str,
     email: str,
     phone: str,
-    born_date: str,
+    born_date: date,
     description: str,
 ) -> ContactModel:
     """
@@ -91,7 +194,7 @@ async def update_contact(
     :param user: The user to update contact for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param name: The new contact's name.
     :type name: str
     :param lastname: The new contact's lastname.
@@ -101,37 +204,35 @@ async def update_contact(
     :param phone: The new contact's phone.
     :type phone: str
     :param born_date: The new contact's born_date.
-    :type born_date: str
+    :type born_date: date
     :param description: The new contact's description.
     :type description: str
     :return: The updated contact.
     :rtype: ContactModel
     """
-    target_contact = (
-        db.query(Contact)
-        .filter(and_(Contact.id == contact_id, Contact.user_id == user.id))
-        .first()
+    fields = {
+        "name": name,
+        "lastname": lastname,
+        "email": email.lower() if email else email,
+        "phone": phone,
+        "born_date": born_date,
+        "description": description,
+    }
+    values = {field: value for field, value in fields.items() if value}
+    if not values:
+        # Nothing to change: read the contact instead of opening a write.
+        return await get_contact(contact_id, user, db)
+
+    result = await db.execute(
+        _UPDATE_CONTACT.values(**values),
+        {"contact_id": contact_id, "owner_id": user.id},
     )
-    if not target_contact:
-        return
-    if name:
-        target_contact.name = name
-    if lastname:
-        target_contact.lastname = lastname
-    if email:
-        target_contact.email = email
-    if phone:
-        target_contact.phone = phone
-    if born_date:
-        target_contact.born_date = born_date
-    if description:
-        target_contact.description = description
-
-    db.commit()
+    target_contact = result.scalar_one_or_none()
+    await db.commit()
     return target_contact
 
 
-async def delete_contact(contact_id, user: User, db: Session) -> Contact | None:
+async def delete_contact(contact_id, user: User, db: AsyncSession) -> Contact | None:
     """
     Delete a single contact with the specified ID for a specific user.
 
@@ -140,23 +241,20 @@ async def delete_contact(contact_id, user: User, db: Session) -> Contact | None:
     :param user: The user to delete contacts for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The deleted contact.
     :rtype: ContactModel
     """
-    item = (
-        db.query(Contact)
-        .filter(and_(Contact.id == contact_id, Contact.user_id == user.id))
-        .first()
+    result = await db.execute(
+        _DELETE_CONTACT, {"contact_id": contact_id, "owner_id": user.id}
     )
-    if item:
-        db.delete(item)
-        db.commit()
-        return item
+    item = result.scalar_one_or_none()
+    await db.commit()
+    return item
 
 
 async def search_data(
-    user: User, db: Session, name: str, lastname: str, email: str
+    user: User, db: AsyncSession, name: str, lastname: str, email: str
 ) -> ContactModel | None:
     """
     Search a single contact with the specified name, lastname or email for a specific user.
@@ -164,7 +262,7 @@ async def search_data(
     :param user: The user to find contact for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param name: The contact's name.
     :type name: str
     :param lastname: The contact's lastname.
@@ -176,49 +274,37 @@ async def search_data(
     """
 
     if name:
-        return (
-            db.query(Contact)
-            .filter(and_(Contact.name == name, Contact.user_id == user.id))
-            .first()
-        )
-    if lastname:
-        return (
-            db.query(Contact)
-            .filter(and_(Contact.lastname == lastname, Contact.user_id == user.id))
-            .first()
-        )
-    if email:
-        return (
-            db.query(Contact)
-            .filter(and_(Contact.email == email, Contact.user_id == user.id))
-            .first()
-        )
-
-
-async def birthday_to_week(user: User, db: Session) -> List[ContactModel] | None:
+        stmt, value = _SEARCH_BY_NAME, name
+    elif lastname:
+        stmt, value = _SEARCH_BY_LASTNAME, lastname
+    elif email:
+        stmt, value = _SEARCH_BY_EMAIL, email.lower()
+    else:
+        return
+    result = await db.execute(stmt, {"value": value, "owner_id": user.id})
+    return result.scalars().first()
+
+
+async def birthday_to_week(user: User, db: AsyncSession) -> List[ContactModel] | None:
     """
     Search for birthday contacts in the coming week.
 
     :param user: The user to find contact for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The list of found contacts.
     :rtype: List[ContactModel]
     """
-    users = db.query(Contact).filter(Contact.user_id == user.id).all()
-    if not users:
+    today = date.today()
+    week = [today + timedelta(days=shift) for shift in range(7)]
+    days = [(day.month, day.day) for day in week]
+    # Outside leap years, Feb 29 birthdays are celebrated on Mar 1.
+    if any(day.month == 3 and day.day == 1 and not isleap(day.year) for day in week):
+        days.append((2, 29))
+    result = await db.execute(_SELECT_BIRTHDAYS, {"owner_id": user.id, "days": days})
+    contacts = result.scalars().all()
+    if not contacts:
         return
-    week = date.today() + timedelta(days=6)
-    happy_users = []
-    for user in users:
-        bday = datetime(
-            date.today().year,
-            user.born_date.month,
-            user.born_date.day,
-        ).date()
-
-        if date.today() <= bday <= week:
-            happy_users.append(user)
-
-    return happy_users
+
+    return contacts
@@ -1,48 +1,113 @@
-from libgravatar import Gravatar
-from sqlalchemy.orm import Session
-from src.database.models import User
-from src.schemas import UserModel
+from functools import lru_cache
+from hashlib import md5
 
+from sqlalchemy import JSON, bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import Contact, User
+from src.schemas import UserDb, UserModel
 
-async def get_user_by_email(email: str, db: Session) -> User:
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+# The user row and all of their contacts aggregated into a JSON array by
+# Postgres, so the nested payload takes a single round trip.
+_SELECT_USER_WITH_CONTACTS = (
+    select(
+        User,
+        func.json_agg(
+            func.json_build_object(
+                "id",
+                Contact.id,
+                "name",
+                Contact.name,
+                "lastname",
+                Contact.lastname,
+                "email",
+                Contact.email,
+                "phone",
+                Contact.phone,
+                "born_date",
+                func.date(Contact.born_date),
+                "description",
+                Contact.description,
+            ),
+            type_=JSON,
+        )
+        .filter(Contact.id.is_not(None))
+        .label("contacts"),
+    )
+    .outerjoin(Contact, Contact.user_id == User.id)
+    .where(User.id == bindparam("user_id"))
+    .group_by(User.id)
+)
+
+
+@lru_cache(maxsize=1024)
+def gravatar_url(email: str) -> str:
+    """
+    Builds the Gravatar image link for an email without any network request.
+
+    :param email: The email to build the link for.
+    :type email: str
+    :return: Link pointing to the Gravatar image.
+    :rtype: str
+    """
+    email_hash = md5(email.strip().lower().encode("utf-8")).hexdigest()
+    return f"https://www.gravatar.com/avatar/{email_hash}?d=identicon"
+
+
+async def get_user_by_email(email: str, db: AsyncSession) -> User:
     """
     Retrieves a single user with the specified email.
 
     :param email: The email to retrieve user for.
     :type email: str
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The single user with the specified email.
     :rtype: User
     """
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(_SELECT_USER_BY_EMAIL, {"email": email})
+    return result.scalar_one_or_none()
+
+
+async def get_user_with_contacts(user_id: int, db: AsyncSession) -> dict | None:
+    """
+    Retrieves a single user together with all of their contacts in one query.
+
+    :param user_id: The ID of the user to retrieve.
+    :type user_id: int
+    :param db: The database session.
+    :type db: AsyncSession
+    :return: The user's fields with a list of contacts or None.
+    :rtype: dict | None
+    """
+    result = await db.execute(_SELECT_USER_WITH_CONTACTS, {"user_id": user_id})
+    row = result.one_or_none()
+    if row is None:
+        return
+    user_data = UserDb.model_validate(row.User).model_dump()
+    return {**user_data, "contacts": row.contacts or []}
 
 
-async def create_user(body: UserModel, db: Session) -> User:
+async def create_user(body: UserModel, db: AsyncSession) -> User:
     """
     Creates a single user with the specified credentials.
 
     :param body: The credentials to create user for.
     :type body: UserModel
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The single user with the specified credentials.
     :rtype: User
     """
-    avatar = None
-    try:
-        g = Gravatar(body.email)
-        avatar = g.get_image()
-    except Exception as e:
-        print(e)
+    avatar = gravatar_url(body.email)
     new_user = User(**body.dict(), avatar=avatar)
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 
-async def update_token(user: User, token: str | None, db: Session) -> None:
+async def update_token(user: User, token: str | None, db: AsyncSession) -> None:
     """
     Updates a token for a single user with the specified credentials.
 
@@ -51,31 +116,30 @@ async def update_token(user: User, token: str | None, db: Session) -> None:
     :param token: Token to update.
     :type token: str
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: None to return.
     :rtype: None
     """
-    user.refresh_token = token
-    db.commit()
+    await db.execute(update(User).where(User.id == user.id).values(refresh_token=token))
+    await db.commit()
 
 
-async def confirmed_email(email: str, db: Session) -> None:
+async def confirmed_email(email: str, db: AsyncSession) -> None:
     """
     Procedure for confirming email upon registration.
 
     :param email: The email for confirmation.
     :type user: str
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: None to return.
     :rtype: None
     """
-    user = await get_user_by_email(email, db)
-    user.confirmed = True
-    db.commit()
+    await db.execute(update(User).where(User.email == email).values(confirmed=True))
+    await db.commit()
 
 
-async def update_avatar(email: str, url: str, db: Session) -> User:
+async def update_avatar(email: str, url: str, db: AsyncSession) -> User:
     """
     Updates an avatar for single user with the specified email.
 
@@ -84,11 +148,18 @@ async def update_avatar(email: str, url: str, db: Session) -> User:
     :param url: Link pointing to avatar.
     :type url: str
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The single user with updated avatar.
     :rtype: User
     """
-    user = await get_user_by_email(email, db)
-    user.avatar = url
-    db.commit()
+    stmt = (
+        update(User)
+        .where(User.email == email)
+        .values(avatar=url)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
+    await db.commit()
     return user
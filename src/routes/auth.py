@@ -15,7 +15,7 @@ from fastapi.security import (
     HTTPBearer,
 )
 from src.schemas import UserModel, UserResponse, TokenModel, RequestEmail
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.schemas import UserModel, UserResponse, TokenModel
@@ -37,7 +37,7 @@ async def signup(
     body: UserModel,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Registration a new user.
@@ -49,7 +49,7 @@ async def signup(
     :param request: The data of request.
     :type request: Request
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: Json with data about new user and success message.
     :rtype: json
     """
@@ -74,7 +74,7 @@ async def signup(
     response_model=TokenModel,
 )
 async def login(
-    body: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
 ):
     """
     Authorization for a specific user.
@@ -82,7 +82,7 @@ async def login(
     :param body: The credentials for Authorization.
     :type body: OAuth2PasswordRequestForm
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: Json with access and refresh tokens and token type.
     :rtype: json
     """
@@ -117,7 +117,7 @@ async def login(
 )
 async def refresh_token(
     credentials: HTTPAuthorizationCredentials = Security(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Creates a new refresh and access tokens.
@@ -125,7 +125,7 @@ async def refresh_token(
     :param credentials: The credentials for specific user.
     :type credentials: HTTPAuthorizationCredentials
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: Json with access and refresh tokens and token type.
     :rtype: json
     """
@@ -151,7 +151,7 @@ async def refresh_token(
 @router.get("/confirmed_email/{token}")
 async def confirmed_email(
     token: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Confirmation a new user's email.
@@ -159,7 +159,7 @@ async def confirmed_email(
     :param token: The token of specific user.
     :type token: str
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param description: RateLimiter's description message.
     :type description: str
     :param dependencies: The database session.
@@ -176,6 +176,7 @@ async def confirmed_email(
     if user.confirmed:
         return {"message": "Your email is already confirmed"}
     await repository_users.confirmed_email(email, db)
+    await auth_service.drop_cached_user(email)
     return {"message": "Email confirmed"}
 
 
@@ -186,7 +187,7 @@ async def request_email(
     body: RequestEmail,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Checking email for confirmation.
@@ -198,7 +199,7 @@ async def request_email(
     :param request: The data of request.
     :type request: Request
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: Json with message about confirmation.
     :rtype: json
     """
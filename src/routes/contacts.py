@@ -1,13 +1,17 @@
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, HTTPException, Depends, status, Path, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.services.auth import auth_service
 from src.database.db import get_db
 from src.database.models import User
 from src.schemas import ContactModel, ResponseContactModel, ContactEmail
 from src.repository import contacts as repository_contacts
 from fastapi_limiter.depends import RateLimiter
+from src.services.limiter import LocalRateLimiter
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
@@ -22,7 +26,7 @@ router = APIRouter(prefix="/contacts", tags=["contacts"])
 )
 async def create_new_contact(
     contact: ContactModel,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
 ):
     """
@@ -31,38 +35,93 @@ async def create_new_contact(
     :param contact: The credentials for new contact.
     :type contact: ContactModel
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param current_user: The current user's data from DB.
     :type current_user: User
     :return: The newly created contsct..
     :rtype: ContactModel
     """
+    try:
+        return await repository_contacts.create_contact(contact, current_user, db)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Contact with this email already exists",
+        )
 
-    return await repository_contacts.create_contact(contact, current_user, db)
+
+# Create several contacts at once
+@router.post(
+    "/bulk",
+    response_model=list[ResponseContactModel],
+    status_code=status.HTTP_201_CREATED,
+    description="No more than 10 requests per minute",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+)
+async def create_new_contacts_bulk(
+    contacts: List[ContactModel] = Body(min_length=1, max_length=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(auth_service.get_current_user),
+):
+    """
+    Registration of several new contacts in one request.
+
+    :param contacts: The credentials for new contacts.
+    :type contacts: List[ContactModel]
+    :param db: The database session.
+    :type db: AsyncSession
+    :param current_user: The current user's data from DB.
+    :type current_user: User
+    :return: The newly created contacts.
+    :rtype: List[ResponseContactModel]
+    """
+    try:
+        return await repository_contacts.create_contacts_bulk(
+            contacts, current_user, db
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Contact with this email already exists",
+        )
 
 
 @router.get(
     "/",
     response_model=list[ResponseContactModel],
     description="No more than 10 requests per minute",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[Depends(LocalRateLimiter(times=10, seconds=60))],
 )
 async def get_all_contacts(
-    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    after_id: int = Query(0, ge=0, description="Return contacts after this ID"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
 ):
     """
     Retrieves a list of contacts for a specific user with specified pagination parameters.
 
+    :param skip: The number of contacts to skip.
+    :type skip: int
+    :param limit: The maximum number of contacts to return.
+    :type limit: int
+    :param after_id: Return only contacts with a greater ID.
+    :type after_id: int
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param current_user: The current user to retrieve contacts for.
     :type current_user: User
     :return: The list of found contacts.
     :rtype: List[ResponseContactModel]
     """
 
-    return await repository_contacts.get_contacts(current_user, db)
+    contacts = await repository_contacts.get_contacts(
+        current_user, db, skip, limit, after_id
+    )
+    # Rows come straight from the database already shaped like the response
+    # model, returning a response directly skips validating each of them.
+    return ORJSONResponse(contacts)
 
 
 # Get one contact with the specific ID
@@ -70,11 +129,11 @@ async def get_all_contacts(
     "/{contact_id}",
     response_model=ResponseContactModel,
     description="No more than 10 requests per minute",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[Depends(LocalRateLimiter(times=10, seconds=60))],
 )
 async def read_contact(
     contact_id: int = Path(description="The ID of the contsct to get", gt=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
 ):
     """
@@ -83,7 +142,7 @@ async def read_contact(
     :param contact_id: The ID of the contact to retrieve.
     :type contact_id: int
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param current_user: The current user to retrieve contacts for.
     :type current_user: User
     :return: The specified contact.
@@ -105,13 +164,13 @@ async def read_contact(
 )
 async def update_contact(
     contact_id: int = Path(description="The ID of the contsct to get", gt=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
     name: str = None,
     lastname: str = None,
     email: str = None,
     phone: str = None,
-    born_date: str = None,
+    born_date: date = None,
     description: str = None,
 ):
     """
@@ -122,7 +181,7 @@ async def update_contact(
     :param user: The user to update contact for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param name: The new contact's name.
     :type name: str
     :param lastname: The new contact's lastname.
@@ -132,23 +191,29 @@ async def update_contact(
     :param phone: The new contact's phone.
     :type phone: str
     :param born_date: The new contact's born_date.
-    :type born_date: str
+    :type born_date: date
     :param description: The new contact's description.
     :type description: str
     :return: The updated contact.
     :rtype: ContactModel
     """
-    target_contact = await repository_contacts.update_contact(
-        contact_id,
-        current_user,
-        db,
-        name,
-        lastname,
-        email,
-        phone,
-        born_date,
-        description,
-    )
+    try:
+        target_contact = await repository_contacts.update_contact(
+            contact_id,
+            current_user,
+            db,
+            name,
+            lastname,
+            email,
+            phone,
+            born_date,
+            description,
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Contact with this email already exists",
+        )
     if target_contact is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NOT FOUND")
     return target_contact
@@ -163,7 +228,7 @@ async def update_contact(
 )
 async def delete_contact(
     contact_id: int = Path(description="The ID of the contsct to get", gt=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
 ):
     """
@@ -172,7 +237,7 @@ async def delete_contact(
     :param contact_id: The ID of the contact to delete.
     :type contact_id: int
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param current_user: The current user to delete contacts for.
     :type current_user: User
     :return: The succeful message.
@@ -192,10 +257,10 @@ async def delete_contact(
     "/search/",
     response_model=ResponseContactModel,
     description="No more than 10 requests per minute",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[Depends(LocalRateLimiter(times=10, seconds=60))],
 )
 async def search_contact(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
     name: str = Query(None),
     lastname: str = Query(None),
@@ -207,7 +272,7 @@ async def search_contact(
     :param current_user: The current user to find contact for.
     :type current_user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param name: The contact's name from request Query.
     :type name: str
     :param lastname: The contact's lastname from request Query.
@@ -232,17 +297,17 @@ async def search_contact(
 @router.get(
     "/birthdays/",
     description="No more than 10 requests per minute",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[Depends(LocalRateLimiter(times=10, seconds=60))],
 )
 async def get_birthday_week(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
 ):
     """
     Search for birthday contacts in the coming week.
 
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :param current_user: The current user to find contact for.
     :type current_user: User
     :return: The list of found contacts.
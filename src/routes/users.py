@@ -1,15 +1,14 @@
-from fastapi import APIRouter, Depends, status, UploadFile, File
-from sqlalchemy.orm import Session
-import cloudinary
-import cloudinary.uploader
+from fastapi import APIRouter, BackgroundTasks, Depends, status, UploadFile, File
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.database.models import User
 from src.repository import users as repository_users
 from src.services.auth import auth_service
-from src.conf.config import settings
-from src.schemas import UserDb
+from src.services.avatar import store_avatar
+from src.schemas import UserContactsResponse, UserDb
 from fastapi_limiter.depends import RateLimiter
+from src.services.limiter import LocalRateLimiter
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -18,7 +17,7 @@ router = APIRouter(prefix="/users", tags=["users"])
     "/me",
     response_model=UserDb,
     description="No more than 10 requests per minute",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[Depends(LocalRateLimiter(times=10, seconds=60))],
 )
 async def read_users_me(current_user: User = Depends(auth_service.get_current_user)):
     """
@@ -32,41 +31,58 @@ async def read_users_me(current_user: User = Depends(auth_service.get_current_us
     return current_user
 
 
+@router.get(
+    "/me/contacts",
+    response_model=UserContactsResponse,
+    description="No more than 10 requests per minute",
+    dependencies=[Depends(LocalRateLimiter(times=10, seconds=60))],
+)
+async def read_users_me_contacts(
+    current_user: User = Depends(auth_service.get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieves a current user together with all of their contacts.
+
+    :param current_user: The user with specified  access token.
+    :type current_user: User
+    :param db: The database session.
+    :type db: AsyncSession
+    :return: The specified user with contacts.
+    :rtype: UserContactsResponse
+    """
+    return await repository_users.get_user_with_contacts(current_user.id, db)
+
+
 @router.patch(
     "/avatar",
     response_model=UserDb,
+    status_code=status.HTTP_202_ACCEPTED,
     description="No more than 10 requests per minute",
     dependencies=[Depends(RateLimiter(times=10, seconds=60))],
 )
 async def update_avatar_user(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(),
     current_user: User = Depends(auth_service.get_current_user),
-    db: Session = Depends(get_db),
 ):
     """
     Updates an avatar for current user.
 
+    The image is uploaded to Cloudinary in the background after the response
+    is sent, the user's link is switched only once the upload succeeded.
+
+    :param background_tasks: The dependence for background execute.
+    :type background_tasks: BackgroundTasks
     :param file: The image for a new avatar.
     :type file: UploadFile
     :param current_user: The user with specified  access token.
     :type current_user: User
-    :param db: The database session.
-    :type db: Session
-    :return: The specified user or error message.
-    :rtype: User | json
+    :return: The specified user as it is before the upload.
+    :rtype: User
     """
-    cloudinary.config(
-        cloud_name=settings.cloudinary_name,
-        api_key=settings.cloudinary_api_key,
-        api_secret=settings.cloudinary_api_secret,
-        secure=True,
-    )
-
-    r = cloudinary.uploader.upload(
-        file.file, public_id=f"NotesApp/{current_user.username}", overwrite=True
+    content = await file.read()
+    background_tasks.add_task(
+        store_avatar, content, current_user.username, current_user.email
     )
-    src_url = cloudinary.CloudinaryImage(f"NotesApp/{current_user.username}").build_url(
-        width=250, height=250, crop="fill", version=r.get("version")
-    )
-    user = await repository_users.update_avatar(current_user.email, src_url, db)
-    return user
+    return current_user
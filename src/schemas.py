@@ -3,6 +3,8 @@ from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field, validator, EmailStr
 
+_PHONE_REGEX = re.compile(r"^\+?\d{2,3}\(?\d{2,3}\)?\s?(\d{2,3}\-?){2}\d{2,3}")
+
 
 class ContactsModel(BaseModel):
     name: str = Field(max_length=50)
@@ -29,8 +31,7 @@ class ContactModel(BaseModel):
 
     @validator("phone")
     def phone_number_must_have_12_digits(cls, phone):
-        match = re.match(r"^\+?\d{2,3}\(?\d{2,3}\)?\s?(\d{2,3}\-?){2}\d{2,3}", phone)
-        if match is None:
+        if _PHONE_REGEX.match(phone) is None:
             raise ValueError("Phone number must have more than 12 digits")
         return phone
 
@@ -66,6 +67,10 @@ class UserDb(BaseModel):
         from_attributes = True
 
 
+class UserContactsResponse(UserDb):
+    contacts: List[ResponseContactModel]
+
+
 class UserResponse(BaseModel):
     user: UserDb
     detail: str = "User successfully created"
@@ -1,5 +1,5 @@
 import pickle
-import redis
+import redis.asyncio as redis
 from typing import Optional
 
 from jose import JWTError, jwt
@@ -7,7 +7,7 @@ from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.repository import users as repository_users
@@ -126,7 +126,7 @@ class Auth:
             )
 
     async def get_current_user(
-        self, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+        self, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
     ):
         """
         Retrieves a current user from DB by access token.
@@ -134,7 +134,7 @@ class Auth:
         :param token: The access token.
         :type token: str.
         :param db: The database session.
-        :type db: Session
+        :type db: AsyncSession
         :return: The specified user or error message.
         :rtype: User | json
         """
@@ -155,17 +155,27 @@ class Auth:
                 raise credentials_exception
         except JWTError as e:
             raise credentials_exception
-        user = self.r.get(f"user:{email}")
+        user = await self.r.get(f"user:{email}")
         if user is None:
             user = await repository_users.get_user_by_email(email, db)
             if user is None:
                 raise credentials_exception
-            self.r.set(f"user:{email}", pickle.dumps(user))
-            self.r.expire(f"user:{email}", 900)
+            await self.r.set(f"user:{email}", pickle.dumps(user), ex=900)
         else:
             user = pickle.loads(user)
         return user
 
+    async def drop_cached_user(self, email: str):
+        """
+        Removes a user from the cache, so the next request reads it from DB.
+
+        :param email: The user's email.
+        :type email: str
+        :return: None to return.
+        :rtype: None
+        """
+        await self.r.delete(f"user:{email}")
+
     def create_email_token(self, data: dict):
         """
         Creates a token.
@@ -0,0 +1,97 @@
+import logging
+from functools import lru_cache
+
+import cloudinary
+import cloudinary.exceptions
+import cloudinary.uploader
+from fastapi.concurrency import run_in_threadpool
+
+from src.conf.config import settings
+from src.database.db import SessionLocal
+from src.repository import users as repository_users
+from src.services.auth import auth_service
+
+logger = logging.getLogger(__name__)
+
+# Configured once on import, so avatar_url never caches a link built before
+# the credentials were set.
+cloudinary.config(
+    cloud_name=settings.cloudinary_name,
+    api_key=settings.cloudinary_api_key,
+    api_secret=settings.cloudinary_api_secret,
+    secure=True,
+)
+
+
+def avatar_public_id(username: str) -> str:
+    """
+    Builds the Cloudinary public id of a user's avatar.
+
+    :param username: The username.
+    :type username: str
+    :return: The public id of the avatar.
+    :rtype: str
+    """
+    return f"NotesApp/{username}"
+
+
+@lru_cache(maxsize=1024)
+def avatar_url(username: str) -> str:
+    """
+    Builds the link to a user's avatar without waiting for the upload.
+
+    :param username: The username.
+    :type username: str
+    :return: Link pointing to avatar.
+    :rtype: str
+    """
+    return cloudinary.CloudinaryImage(avatar_public_id(username)).build_url(
+        width=250, height=250, crop="fill"
+    )
+
+
+def upload_avatar(content: bytes, username: str) -> bool:
+    """
+    Uploads an image as a user's avatar, replacing the previous one.
+
+    :param content: The image data.
+    :type content: bytes
+    :param username: The username.
+    :type username: str
+    :return: Whether Cloudinary stored the image.
+    :rtype: bool
+    """
+    try:
+        cloudinary.uploader.upload(
+            content,
+            public_id=avatar_public_id(username),
+            overwrite=True,
+            invalidate=True,
+        )
+    except cloudinary.exceptions.Error:
+        logger.exception("Avatar upload for %s failed", username)
+        return False
+    return True
+
+
+async def store_avatar(content: bytes, username: str, email: str) -> None:
+    """
+    Uploads a user's avatar and points the user at it once it is stored.
+
+    Meant to run as a background task, so it opens its own database session.
+    On a failed upload the user keeps the previous avatar.
+
+    :param content: The image data.
+    :type content: bytes
+    :param username: The username.
+    :type username: str
+    :param email: The user's email.
+    :type email: str
+    :return: None to return.
+    :rtype: None
+    """
+    if not await run_in_threadpool(upload_avatar, content, username):
+        return
+    async with SessionLocal() as db:
+        await repository_users.update_avatar(email, avatar_url(username), db)
+    await auth_service.drop_cached_user(email)
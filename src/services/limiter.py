@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+from math import ceil
+
+from fastapi import HTTPException, Request, status
+
+from src.conf.config import settings
+
+
+class LocalRateLimiter:
+    """
+    Fixed window rate limiter that counts requests in process memory.
+
+    Unlike ``fastapi_limiter.depends.RateLimiter`` it makes no Redis round
+    trip, so it is meant for cheap read endpoints. Every instance keeps its
+    own counters, so use one instance per route; limits apply per worker.
+
+    Clients are told apart by their address. ``X-Forwarded-For`` is only read
+    when the request comes from one of the trusted proxies. At most
+    ``max_keys`` clients are tracked, new clients are rejected until a window
+    expires rather than evicting live ones.
+    """
+
+    max_keys = 10_000
+
+    def __init__(
+        self,
+        times: int = 1,
+        seconds: int = 60,
+        trusted_proxies: list[str] | None = None,
+    ):
+        self.times = times
+        self.seconds = seconds
+        if trusted_proxies is None:
+            trusted_proxies = settings.trusted_proxies
+        self.trusted_proxies = frozenset(trusted_proxies)
+        # Ordered by window start, so expired windows are always at the front.
+        self.windows: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    def _purge(self, now: float) -> None:
+        """
+        Drops the counters whose window has already expired.
+
+        Stops at the first live window, so a call costs only as much as the
+        number of windows it removes.
+
+        :param now: The current monotonic time.
+        :type now: float
+        :return: None to return.
+        :rtype: None
+        """
+        while self.windows:
+            started, _ = next(iter(self.windows.values()))
+            if now - started < self.seconds:
+                break
+            self.windows.popitem(last=False)
+
+    def _client_key(self, request: Request) -> str:
+        """
+        Picks the address the request is counted against.
+
+        Behind trusted proxies the client is the rightmost ``X-Forwarded-For``
+        entry that is not a proxy itself, entries left of it are set by the
+        client and can't be trusted.
+
+        :param request: The data of request.
+        :type request: Request
+        :return: The client address.
+        :rtype: str
+        """
+        host = request.client.host if request.client else ""
+        forwarded = request.headers.get("X-Forwarded-For")
+        if not forwarded or host not in self.trusted_proxies:
+            return host
+        hops = [hop.strip() for hop in forwarded.split(",")]
+        for hop in reversed(hops):
+            if hop not in self.trusted_proxies:
+                return hop
+        return hops[0]
+
+    async def __call__(self, request: Request):
+        """
+        Counts the request and rejects it once the limit is reached.
+
+        :param request: The data of request.
+        :type request: Request
+        :return: None to return or error message.
+        :rtype: None | json
+        """
+        key = self._client_key(request)
+        now = time.monotonic()
+        self._purge(now)
+
+        window = self.windows.get(key)
+        if window is None and len(self.windows) >= self.max_keys:
+            # Too many clients inside one window: wait for the oldest to end.
+            started, count = next(iter(self.windows.values()))[0], self.times
+        else:
+            started, count = window or (now, 0)
+        if count >= self.times:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too Many Requests",
+                headers={"Retry-After": str(ceil(started + self.seconds - now))},
+            )
+        self.windows[key] = (started, count + 1)
@@ -1,19 +1,84 @@
+import os
+
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
-from main import app
 from src.database.models import Base
 from src.database.db import get_db
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Each pytest-xdist worker gets its own database file.
+TEST_DB = f"./test{os.environ.get('PYTEST_XDIST_WORKER', '')}.db"
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DB}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient may run each request on its own event loop, so don't pool
+# aiosqlite connections between requests.
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+class FakeResult:
+    # Every accessor the repository uses returns the preset "one" or "many".
+    __slots__ = ("one", "many")
+
+    def __init__(self):
+        self.one = None
+        self.many = None
+
+    def scalar_one_or_none(self):
+        return self.one
+
+    def one_or_none(self):
+        return self.one
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def first(self):
+        return self.one
+
+    def all(self):
+        return self.many
+
+
+class FakeSession:
+    # Only the AsyncSession calls made by src.repository.contacts.
+    def __init__(self):
+        self.result = FakeResult()
+        self.executed = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        return self.result
+
+    def add(self, instance):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, instance):
+        pass
+
+
+@pytest.fixture
+def fake_session():
+    return FakeSession()
+
 
 @pytest.fixture(scope="module")
 def session():
@@ -31,13 +96,15 @@ def session():
 
 @pytest.fixture(scope="module")
 def client(session):
+    # Imported here so that runs selecting only unit tests never load the app.
+    from fastapi.testclient import TestClient
+    from main import app
+
     # Dependency override
 
-    def override_get_db():
-        try:
-            yield session
-        finally:
-            session.close()
+    async def override_get_db():
+        async with AsyncTestingSessionLocal() as db:
+            yield db
 
     app.dependency_overrides[get_db] = override_get_db
 
@@ -1,8 +1,8 @@
 import datetime
-import unittest
-from unittest.mock import MagicMock
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+import inspect
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 from src.schemas import ContactModel
@@ -10,231 +10,283 @@ from src.repository.contacts import (
     get_contacts,
     get_contact,
     create_contact,
+    create_contacts_bulk,
     delete_contact,
     update_contact,
     search_data,
     birthday_to_week,
 )
 from src.database.models import Contact, User
+from tests.conftest import FakeSession
 
+# Test data is known to be valid, so skip pydantic validation.
+BILL = ContactModel.model_construct(
+    name="Bill",
+    lastname="Fork",
+    email="fork_bill@gmail.com",
+    phone="3800502128506",
+    born_date=datetime.date(1988, 1, 12),
+    description="Just friend",
+)
+_UPDATE_KW = dict(
+    name="Bill",
+    lastname="Fork",
+    email="fork_bill@gmail.com",
+    phone="3800502128506",
+    born_date=datetime.date(1988, 1, 12),
+    description="Just strange friend",
+)
+BILL_SOON = BILL.model_copy(
+    update={"born_date": datetime.date.today() + datetime.timedelta(days=3)}
+)
 
-class TestContacts(unittest.IsolatedAsyncioTestCase):
-
-    def setUp(self):
-        self.session = MagicMock(spec=Session)
-        self.user = User(id=1)
-        self.contact_id = 1
-
-    async def test_get_contacts(self):
-        contacts = [
-            Contact(),
-        ]
-        self.session.query().filter().all.return_value = contacts
-        result = await get_contacts(user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_get_contact_found(self):
-        contact = Contact()
-        self.session.query().filter().first.return_value = contact
-        result = await get_contact(contact_id=1, user=self.user, db=self.session)
-        self.assertEqual(result, contact)
-
-    async def test_get_contact_not_found(self):
-        self.session.query().filter().first.return_value = None
-        result = await get_contact(contact_id=1, user=self.user, db=self.session)
-        self.assertIsNone(result)
-
-    async def test_create_contact(self):
-        body = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-
-        result = await create_contact(contact=body, user=self.user, db=self.session)
-        self.assertEqual(result.name, body.name)
-        self.assertEqual(result.lastname, body.lastname)
-        self.assertEqual(result.email, body.email)
-        self.assertEqual(result.phone, body.phone)
-        self.assertEqual(result.born_date, body.born_date)
-        self.assertEqual(result.description, body.description)
-
-        self.assertTrue(hasattr(result, "id"))
-
-    async def test_delete_contact_found(self):
-        contact = Contact()
-        self.session.query().filter().first.return_value = contact
-        result = await delete_contact(
-            contact_id=self.contact_id, user=self.user, db=self.session
-        )
-        self.assertEqual(result, contact)
-
-    async def test_delete_contact_not_found(self):
-
-        self.session.query().filter().first.return_value = None
-        result = await delete_contact(contact_id=1, user=self.user, db=self.session)
-        self.assertIsNone(result)
-
-    async def test_update_contact_found(self):
-        contact = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-
-        self.session.query().filter().first.return_value = contact
-        self.session.commit.return_value = None
-        result = await update_contact(
-            contact_id=1,
-            user=self.user,
-            db=self.session,
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just strange friend",
-        )
-        self.assertEqual(result, contact)
-
-    async def test_update_contact_not_found(self):
-        contact = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-
-        self.session.query().filter().first.return_value = None
-        self.session.commit.return_value = None
-        result = await update_contact(
-            contact_id=1,
-            user=self.user,
-            db=self.session,
+# Run every test on one session-wide event loop instead of a loop per test.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="module")
+def owner():
+    return User(id=1)
+
+
+@pytest.mark.parametrize("name", ["execute", "add", "commit", "refresh"])
+async def test_fake_session_matches_async_session(name):
+    # What create_autospec(AsyncSession) would enforce, checked once instead
+    # of re-specced for every test.
+    fake = getattr(FakeSession, name)
+    real = getattr(AsyncSession, name)
+    assert inspect.iscoroutinefunction(fake) == inspect.iscoroutinefunction(real)
+    fake_params = list(inspect.signature(fake).parameters)
+    real_params = list(inspect.signature(real).parameters)
+    assert real_params[: len(fake_params)] == fake_params
+
+
+async def test_get_contacts(fake_session, owner):
+    contacts = [
+        {
+            "id": 1,
+            "name": "Bill",
+            "lastname": "Fork",
+            "email": "fork_bill@gmail.com",
+            "phone": "3800502128506",
+            "born_date": datetime.date(1988, 1, 12),
+            "description": "Just friend",
+        },
+    ]
+    fake_session.result.many = contacts
+    result = await get_contacts(user=owner, db=fake_session)
+    assert result == contacts
+    assert fake_session.executed[-1][1] == {
+        "owner_id": owner.id,
+        "after_id": 0,
+        "skip": 0,
+        "limit": 50,
+    }
+
+
+async def test_get_contacts_page(fake_session, owner):
+    fake_session.result.many = []
+    result = await get_contacts(
+        user=owner, db=fake_session, skip=10, limit=20, after_id=42
+    )
+    assert result == []
+    assert fake_session.executed[-1][1] == {
+        "owner_id": owner.id,
+        "after_id": 42,
+        "skip": 10,
+        "limit": 20,
+    }
+
+
+@pytest.mark.parametrize("stored", [Contact(), None], ids=["found", "not_found"])
+async def test_get_contact(fake_session, owner, stored):
+    fake_session.result.one = stored
+    result = await get_contact(contact_id=1, user=owner, db=fake_session)
+    assert result is stored
+
+
+async def test_create_contact(fake_session, owner):
+    result = await create_contact(contact=BILL, user=owner, db=fake_session)
+    assert result.name == BILL.name
+    assert result.lastname == BILL.lastname
+    assert result.email == BILL.email
+    assert result.phone == BILL.phone
+    assert result.born_date == BILL.born_date
+    assert result.description == BILL.description
+
+    assert hasattr(result, "id")
+
+
+async def test_create_contact_lowercases_email(fake_session, owner):
+    body = BILL.model_copy(update={"email": "Fork_Bill@Gmail.com"})
+    result = await create_contact(contact=body, user=owner, db=fake_session)
+    assert result.email == "fork_bill@gmail.com"
+
+
+async def test_create_contacts_bulk(fake_session, owner):
+    body = [
+        BILL,
+        ContactModel.model_construct(
             name="Deira",
             lastname="Hadid",
-            email="dhadid@gmail.com",
+            email="DHadid@Gmail.com",
             phone="3800502128506",
-            born_date="1988-01-12",
+            born_date=datetime.date(1990, 5, 21),
             description="Just strange friend",
-        )
-        self.assertIsNone(result)
-
-    async def test_search_contact_found_name(self):
-        contact = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-        self.session.query().filter().first.return_value = contact
-        result = await search_data(
-            user=self.user,
-            db=self.session,
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-        )
-        self.assertEqual(result, contact)
-
-    async def test_search_contact_found_lastname(self):
-        contact = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-        self.session.query().filter().first.return_value = contact
-        result = await search_data(
-            user=self.user,
-            db=self.session,
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-        )
-        self.assertEqual(result, contact)
-
-    async def test_search_contact_found_email(self):
-        contact = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-        self.session.query().filter().first.return_value = contact
-        result = await search_data(
-            user=self.user,
-            db=self.session,
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-        )
-        self.assertEqual(result, contact)
-
-    async def test_search_contact_found_all_together(self):
-        contact = ContactModel(
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-            phone="3800502128506",
-            born_date="1988-01-12",
-            description="Just friend",
-        )
-        self.session.query().filter().first.return_value = contact
-        result = await search_data(
-            user=self.user,
-            db=self.session,
-            name="Bill",
-            lastname="Fork",
-            email="fork_bill@gmail.com",
-        )
-        self.assertEqual(result, contact)
-
-    async def test_search_contact_not_found(self):
-        self.session.query().filter().first.return_value = None
-        result = await search_data(
-            user=self.user,
-            db=self.session,
-            name="Brenda",
-            lastname="Gerard",
-            email="breger@gmail.com",
-        )
-        self.assertIsNone(result)
-
-    async def test_birthday_to_week_found(self):
-        contacts = [
-            ContactModel(
-                name="Bill",
-                lastname="Fork",
-                email="fork_bill@gmail.com",
-                phone="3800502128506",
-                born_date=datetime.date.today() + datetime.timedelta(days=3),
-                description="Just friend",
-            ),
-        ]
-        self.session.query().filter().all.return_value = contacts
-        result = await birthday_to_week(user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_birthday_to_week_not_found(self):
-        self.session.query().filter().all.return_value = None
-        result = await birthday_to_week(user=self.user, db=self.session)
-        self.assertIsNone(result)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        ),
+    ]
+    contacts = [Contact(), Contact()]
+    fake_session.result.many = contacts
+    result = await create_contacts_bulk(contacts=body, user=owner, db=fake_session)
+    assert result == contacts
+    rows = fake_session.executed[-1][1]
+    assert [row["email"] for row in rows] == ["fork_bill@gmail.com", "dhadid@gmail.com"]
+    assert all(row["user_id"] == owner.id for row in rows)
+
+
+async def test_create_contacts_bulk_empty(fake_session, owner):
+    result = await create_contacts_bulk(contacts=[], user=owner, db=fake_session)
+    assert result == []
+    assert fake_session.executed == []
+    assert fake_session.commits == 0
+
+
+@pytest.mark.parametrize("stored", [Contact(), None], ids=["found", "not_found"])
+async def test_delete_contact(fake_session, owner, stored):
+    fake_session.result.one = stored
+    result = await delete_contact(contact_id=1, user=owner, db=fake_session)
+    assert result is stored
+
+
+async def test_update_contact_found(fake_session, owner):
+    fake_session.result.one = BILL
+    result = await update_contact(
+        contact_id=1,
+        user=owner,
+        db=fake_session,
+        **_UPDATE_KW,
+    )
+    assert result == BILL
+
+
+async def test_update_contact_lowercases_email(fake_session, owner):
+    fake_session.result.one = BILL
+    await update_contact(
+        contact_id=1,
+        user=owner,
+        db=fake_session,
+        **{**_UPDATE_KW, "email": "Fork_Bill@Gmail.com"},
+    )
+    statement = fake_session.executed[-1][0]
+    assert statement.compile().params["email"] == "fork_bill@gmail.com"
+
+
+async def test_update_contact_not_found(fake_session, owner):
+    fake_session.result.one = None
+    result = await update_contact(
+        contact_id=1,
+        user=owner,
+        db=fake_session,
+        **{
+            **_UPDATE_KW,
+            "name": "Deira",
+            "lastname": "Hadid",
+            "email": "dhadid@gmail.com",
+        },
+    )
+    assert result is None
+
+
+async def test_update_contact_no_changes(fake_session, owner):
+    fake_session.result.one = BILL
+    result = await update_contact(
+        contact_id=1,
+        user=owner,
+        db=fake_session,
+        **dict.fromkeys(_UPDATE_KW),
+    )
+    assert result == BILL
+    assert fake_session.commits == 0
+
+
+@pytest.mark.parametrize(
+    "fields, value",
+    [
+        ({"name": "Bill", "lastname": None, "email": None}, "Bill"),
+        ({"name": None, "lastname": "Fork", "email": None}, "Fork"),
+        (
+            {"name": None, "lastname": None, "email": "Fork_Bill@gmail.com"},
+            "fork_bill@gmail.com",
+        ),
+        (
+            {"name": "Bill", "lastname": "Fork", "email": "fork_bill@gmail.com"},
+            "Bill",
+        ),
+    ],
+    ids=["name", "lastname", "email", "all_together"],
+)
+async def test_search_contact_found(fake_session, owner, fields, value):
+    fake_session.result.one = BILL
+    result = await search_data(user=owner, db=fake_session, **fields)
+    assert result == BILL
+    assert fake_session.executed[-1][1]["value"] == value
+
+
+async def test_search_contact_not_found(fake_session, owner):
+    fake_session.result.one = None
+    result = await search_data(
+        user=owner,
+        db=fake_session,
+        name="Brenda",
+        lastname="Gerard",
+        email="breger@gmail.com",
+    )
+    assert result is None
+
+
+async def test_birthday_to_week_found(fake_session, owner):
+    contacts = [BILL_SOON]
+    fake_session.result.many = contacts
+    result = await birthday_to_week(user=owner, db=fake_session)
+    assert result == contacts
+    params = fake_session.executed[-1][1]
+    week = [datetime.date.today() + datetime.timedelta(days=n) for n in range(7)]
+    assert params["owner_id"] == owner.id
+    # An eighth (2, 29) is added when the week holds Mar 1 of a non-leap year.
+    assert params["days"][:7] == [(day.month, day.day) for day in week]
+
+
+@pytest.mark.parametrize(
+    "today, days",
+    [
+        (
+            datetime.date(2024, 2, 26),
+            [(2, 26), (2, 27), (2, 28), (2, 29), (3, 1), (3, 2), (3, 3)],
+        ),
+        (
+            datetime.date(2023, 12, 28),
+            [(12, 28), (12, 29), (12, 30), (12, 31), (1, 1), (1, 2), (1, 3)],
+        ),
+        (
+            datetime.date(2023, 2, 25),
+            [(2, 25), (2, 26), (2, 27), (2, 28), (3, 1), (3, 2), (3, 3), (2, 29)],
+        ),
+    ],
+    ids=["month_boundary", "year_boundary", "non_leap_feb_29"],
+)
+async def test_birthday_to_week_days(fake_session, owner, monkeypatch, today, days):
+    class FixedDate(datetime.date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr("src.repository.contacts.date", FixedDate)
+    fake_session.result.many = [BILL_SOON]
+    await birthday_to_week(user=owner, db=fake_session)
+    assert fake_session.executed[-1][1]["days"] == days
+
+
+async def test_birthday_to_week_not_found(fake_session, owner):
+    fake_session.result.many = None
+    result = await birthday_to_week(user=owner, db=fake_session)
+    assert result is None
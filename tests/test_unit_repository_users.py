@@ -0,0 +1,62 @@
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.database.models import User
+from src.repository.users import get_user_with_contacts
+from src.schemas import UserContactsResponse
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+DEADPOOL = User(
+    id=1,
+    username="deadpool",
+    email="deadpool@example.com",
+    password="hashed",
+    created_at=datetime.datetime(2024, 3, 1, 12, 0),
+    avatar="https://example.com/deadpool.png",
+    refresh_token="token",
+    confirmed=True,
+)
+USER_FIELDS = {
+    "id": 1,
+    "username": "deadpool",
+    "email": "deadpool@example.com",
+    "created_at": datetime.datetime(2024, 3, 1, 12, 0),
+    "avatar": "https://example.com/deadpool.png",
+}
+
+
+async def test_get_user_with_contacts(fake_session):
+    contacts = [
+        {
+            "id": 1,
+            "name": "Bill",
+            "lastname": "Fork",
+            "email": "fork_bill@gmail.com",
+            "phone": "3800502128506",
+            "born_date": "1988-01-12",
+            "description": "Just friend",
+        },
+    ]
+    fake_session.result.one = SimpleNamespace(User=DEADPOOL, contacts=contacts)
+    result = await get_user_with_contacts(user_id=1, db=fake_session)
+    assert result == {**USER_FIELDS, "contacts": contacts}
+    assert fake_session.executed[-1][1] == {"user_id": 1}
+    # The route serves it through this response model.
+    response = UserContactsResponse.model_validate(result)
+    assert response.contacts[0].born_date == datetime.date(1988, 1, 12)
+
+
+async def test_get_user_with_contacts_none(fake_session):
+    # json_agg over no contacts is NULL.
+    fake_session.result.one = SimpleNamespace(User=DEADPOOL, contacts=None)
+    result = await get_user_with_contacts(user_id=1, db=fake_session)
+    assert result == {**USER_FIELDS, "contacts": []}
+
+
+async def test_get_user_with_contacts_not_found(fake_session):
+    fake_session.result.one = None
+    result = await get_user_with_contacts(user_id=1, db=fake_session)
+    assert result is None
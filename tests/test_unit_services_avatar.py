@@ -0,0 +1,61 @@
+import logging
+from contextlib import asynccontextmanager
+
+import cloudinary.exceptions
+import pytest
+
+from src.services import avatar
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture
+def stored(monkeypatch, fake_session):
+    calls = []
+
+    @asynccontextmanager
+    async def session_local():
+        yield fake_session
+
+    async def update_avatar(email, url, db):
+        calls.append(("update_avatar", email, url, db))
+
+    async def drop_cached_user(email):
+        calls.append(("drop_cached_user", email))
+
+    monkeypatch.setattr(avatar, "SessionLocal", session_local)
+    monkeypatch.setattr(avatar.repository_users, "update_avatar", update_avatar)
+    monkeypatch.setattr(avatar.auth_service, "drop_cached_user", drop_cached_user)
+    return calls
+
+
+async def test_upload_avatar_logs_failure(monkeypatch, caplog):
+    def upload(*args, **kwargs):
+        raise cloudinary.exceptions.Error("boom")
+
+    monkeypatch.setattr(avatar.cloudinary.uploader, "upload", upload)
+    with caplog.at_level(logging.ERROR, logger=avatar.logger.name):
+        assert avatar.upload_avatar(b"img", "deadpool") is False
+    assert "Avatar upload for deadpool failed" in caplog.text
+
+
+async def test_store_avatar_switches_link_after_upload(
+    monkeypatch, stored, fake_session
+):
+    monkeypatch.setattr(avatar, "upload_avatar", lambda content, username: True)
+    await avatar.store_avatar(b"img", "deadpool", "deadpool@example.com")
+    assert stored == [
+        (
+            "update_avatar",
+            "deadpool@example.com",
+            avatar.avatar_url("deadpool"),
+            fake_session,
+        ),
+        ("drop_cached_user", "deadpool@example.com"),
+    ]
+
+
+async def test_store_avatar_keeps_link_on_failure(monkeypatch, stored):
+    monkeypatch.setattr(avatar, "upload_avatar", lambda content, username: False)
+    await avatar.store_avatar(b"img", "deadpool", "deadpool@example.com")
+    assert stored == []
@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.services import limiter
+from src.services.limiter import LocalRateLimiter
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    # Replace the module's time reference only, the event loop keeps its own.
+    monkeypatch.setattr(limiter, "time", clock)
+    return clock
+
+
+def make_request(host="10.0.0.1", forwarded=None):
+    headers = {"X-Forwarded-For": forwarded} if forwarded else {}
+    client = SimpleNamespace(host=host) if host else None
+    return SimpleNamespace(headers=headers, client=client)
+
+
+async def test_allows_requests_up_to_the_limit(clock):
+    rate_limiter = LocalRateLimiter(times=3, seconds=60)
+    for _ in range(3):
+        assert await rate_limiter(make_request()) is None
+    assert rate_limiter.windows["10.0.0.1"] == (1000.0, 3)
+
+
+async def test_rejects_with_retry_after(clock):
+    rate_limiter = LocalRateLimiter(times=2, seconds=60)
+    await rate_limiter(make_request())
+    clock.now += 10
+    await rate_limiter(make_request())
+    clock.now += 15.5
+    with pytest.raises(HTTPException) as err:
+        await rate_limiter(make_request())
+    assert err.value.status_code == 429
+    assert err.value.headers == {"Retry-After": "35"}
+
+
+async def test_window_resets_after_expiry(clock):
+    rate_limiter = LocalRateLimiter(times=1, seconds=60)
+    await rate_limiter(make_request())
+    clock.now += 59.9
+    with pytest.raises(HTTPException):
+        await rate_limiter(make_request())
+    clock.now += 0.1
+    assert await rate_limiter(make_request()) is None
+    assert rate_limiter.windows["10.0.0.1"] == (1060.0, 1)
+
+
+@pytest.mark.parametrize(
+    "request_kwargs, key",
+    [
+        ({"forwarded": "203.0.113.7"}, "10.0.0.1"),
+        ({"host": "10.0.0.9", "forwarded": "1.1.1.1, 203.0.113.7"}, "203.0.113.7"),
+        ({"host": "10.0.0.9", "forwarded": "203.0.113.7, 10.0.0.8"}, "203.0.113.7"),
+        ({"host": "10.0.0.9", "forwarded": "10.0.0.8"}, "10.0.0.8"),
+        ({"host": "10.0.0.9"}, "10.0.0.9"),
+        ({"host": None, "forwarded": "203.0.113.7"}, ""),
+    ],
+    ids=[
+        "untrusted_forwarded_for",
+        "trusted_proxy",
+        "trusted_proxy_chain",
+        "only_proxies",
+        "proxy_without_header",
+        "no_client",
+    ],
+)
+async def test_key_selection(clock, request_kwargs, key):
+    rate_limiter = LocalRateLimiter(
+        times=1, seconds=60, trusted_proxies=["10.0.0.9", "10.0.0.8"]
+    )
+    await rate_limiter(make_request(**request_kwargs))
+    assert list(rate_limiter.windows) == [key]
+
+
+async def test_clients_are_counted_separately(clock):
+    rate_limiter = LocalRateLimiter(times=1, seconds=60)
+    await rate_limiter(make_request(host="10.0.0.1"))
+    assert await rate_limiter(make_request(host="10.0.0.2")) is None
+
+
+async def test_purges_expired_windows(clock):
+    rate_limiter = LocalRateLimiter(times=5, seconds=60)
+    await rate_limiter(make_request(host="10.0.0.1"))
+    clock.now += 30
+    await rate_limiter(make_request(host="10.0.0.2"))
+    clock.now += 30
+    await rate_limiter(make_request(host="10.0.0.3"))
+    assert list(rate_limiter.windows) == ["10.0.0.2", "10.0.0.3"]
+
+
+async def test_rejects_new_clients_over_max_keys(clock, monkeypatch):
+    monkeypatch.setattr(LocalRateLimiter, "max_keys", 2)
+    rate_limiter = LocalRateLimiter(times=5, seconds=60)
+    await rate_limiter(make_request(host="10.0.0.1"))
+    clock.now += 10
+    await rate_limiter(make_request(host="10.0.0.2"))
+    with pytest.raises(HTTPException) as err:
+        await rate_limiter(make_request(host="10.0.0.3"))
+    assert err.value.status_code == 429
+    assert err.value.headers == {"Retry-After": "50"}
+    # Clients already tracked keep their counters.
+    assert await rate_limiter(make_request(host="10.0.0.1")) is None
+    assert rate_limiter.windows["10.0.0.1"] == (1000.0, 2)
+    clock.now += 50
+    assert await rate_limiter(make_request(host="10.0.0.3")) is None